@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
+# Width, height and depth of the dungeon.
+SIZE = 7
 
-class Feature(Enum):
+
+class Feature(IntEnum):
     EMPTY = 0
     MIRROR = 1
     SCROLL = 2
@@ -18,14 +21,14 @@ class Feature(Enum):
     EXIT = 11
 
 
-class Race(Enum):
+class Race(IntEnum):
     HUMAN = 1
     DWARF = 2
     ELF = 3
     HALFLING = 4
 
 
-class Spell(Enum):
+class Spell(IntEnum):
     PROTECTION = 1
     FIREBALL = 2
     LIGHTNING = 3
@@ -33,30 +36,32 @@ class Spell(Enum):
     TELEPORT = 5
 
 
-class Mode(Enum):
+class Mode(IntEnum):
     EXPLORE = 1
     ENCOUNTER = 2
     GAME_OVER = 3
     VICTORY = 4
 
 
-EXPLORE_COMMANDS = {
-    "N",
-    "S",
-    "E",
-    "W",
-    "U",
-    "D",
-    "F",
-    "X",
-    "L",
-    "O",
-    "R",
-    "P",
-    "B",
-    "H",
-}
-ENCOUNTER_COMMANDS = {"F", "R", "S"}
+EXPLORE_COMMANDS = frozenset(
+    {
+        "N",
+        "S",
+        "E",
+        "W",
+        "U",
+        "D",
+        "F",
+        "X",
+        "L",
+        "O",
+        "R",
+        "P",
+        "B",
+        "H",
+    }
+)
+ENCOUNTER_COMMANDS = frozenset({"F", "R", "S"})
 
 MONSTER_NAMES = [
     "Skeleton",
@@ -103,17 +108,18 @@ POTION_PRICES = {
     "ATTRIBUTE": 100,
 }
 
-FEATURE_SYMBOLS = {
-    Feature.EMPTY: "-",
-    Feature.MIRROR: "m",
-    Feature.SCROLL: "s",
-    Feature.CHEST: "c",
-    Feature.FLARES: "f",
-    Feature.POTION: "p",
-    Feature.VENDOR: "v",
-    Feature.THIEF: "t",
-    Feature.WARP: "w",
-    Feature.STAIRS_UP: "U",
-    Feature.STAIRS_DOWN: "D",
-    Feature.EXIT: "X",
-}
+# Indexed by Feature value.
+FEATURE_SYMBOLS = (
+    "-",
+    "m",
+    "s",
+    "c",
+    "f",
+    "p",
+    "v",
+    "t",
+    "w",
+    "U",
+    "D",
+    "X",
+)
@@ -9,7 +9,7 @@ from dungeon.model import Player
 from dungeon.types import Event
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterResult:
     events: list[Event]
     done: bool = False
@@ -19,6 +19,45 @@ class EncounterResult:
     enter_room: bool = False
 
 
+# Fixed odds as thresholds against getrandbits(_ODDS_BITS), i.e. out of 1024.
+_ODDS_BITS = 10
+_WEAPON_BREAK_ODDS = 51  # ~5%
+_RUN_ESCAPE_ODDS = 410  # ~40%
+_FINAL_ATTACK_ODDS = 307  # ~30%
+
+# A fight round draws all of its randomness at once: 16 bits for the hit roll,
+# 16 bits for the damage variance and _ODDS_BITS for the weapon break check.
+# The 16-bit fields keep modulo bias well under 0.1%.
+_FIGHT_BITS = 32 + _ODDS_BITS
+
+_SPELL_MENU = (
+    ("P", Spell.PROTECTION, "Protection"),
+    ("F", Spell.FIREBALL, "Fireball"),
+    ("L", Spell.LIGHTNING, "Lightning"),
+    ("W", Spell.WEAKEN, "Weaken"),
+    ("T", Spell.TELEPORT, "Teleport"),
+)
+_SPELL_KEYS = {key: spell for key, spell, _label in _SPELL_MENU}
+
+_EV_UNKNOWN_ERR = Event.error("I don't understand that.")
+_EV_UNKNOWN_INFO = Event.info("I don't understand that.")
+_EV_READY = Event.info("You ready yourself for the fight.")
+_EV_FATIGUED = Event.info("You are quite fatigued after your previous efforts.")
+_EV_DEATH = Event.info("YOU HAVE DIED.")
+_EV_WEAPON_BREAKS = Event.info("Your weapon breaks with the impact!")
+_EV_DODGE = Event.combat("You deftly dodge the blow!")
+_EV_FINAL_ATTACK = Event.combat(
+    "As he dies, though, he launches one final desperate attack."
+)
+_EV_CHOOSE_SPELL = Event.error("Choose P/F/L/W/T or Esc to cancel.")
+_EV_IQ_TOO_LOW = Event.info("You have insufficient intelligence.")
+_EV_SPELL_UNKNOWN = Event.info("You know not that spell.")
+_EV_ARMOUR_GLOWS = Event.info("Your armour glows briefly in response to your spell.")
+_EV_CLOTHES_GLOW = Event.info(
+    "Your clothes glow briefly, becoming, temporarily, armour."
+)
+
+
 def _reset_player_after_encounter(player: Player) -> None:
     player.fatigued = False
     player.temp_armor_bonus = 0
@@ -36,6 +75,8 @@ class EncounterSession:
         debug: bool,
     ) -> None:
         self.rng = rng
+        self._randint = rng.randint
+        self._getrandbits = rng.getrandbits
         self.player = player
         self.monster_level = monster_level
         self.monster_name = monster_name
@@ -43,6 +84,14 @@ class EncounterSession:
         self.awaiting_spell = False
         self.debug = debug
 
+        # Per-encounter invariants, fixed for the life of the session.
+        self._base_score = 20 + 5 * (11 - monster_level)
+        self._damage_base = math.floor(2.5 + monster_level / 3)
+        self._msg_evades = f"The {monster_name} evades your blow!"
+        self._msg_you_hit = f"You hit the {monster_name}!"
+        self._msg_hits_you = f"The {monster_name} hits you!"
+        self._msg_expires = f"The foul {monster_name} expires."
+
     @classmethod
     def start(
         cls,
@@ -80,38 +129,25 @@ class EncounterSession:
 
     def attempt_cancel(self) -> EncounterResult:
         if not self.awaiting_spell:
-            return self._with_debug(
-                EncounterResult(events=[Event.info("I don't understand that.")])
-            )
+            return self._with_debug(EncounterResult(events=[_EV_UNKNOWN_INFO]))
         self.awaiting_spell = False
-        return self._with_debug(
-            EncounterResult(events=[Event.info("You ready yourself for the fight.")])
-        )
+        return self._with_debug(EncounterResult(events=[_EV_READY]))
 
     def step(self, raw: str) -> EncounterResult:
         if self.awaiting_spell:
             return self._with_debug(self._handle_spell_choice(raw))
         if not raw:
-            return self._with_debug(
-                EncounterResult(events=[Event.error("I don't understand that.")])
-            )
-        key = raw[0]
-        match key:
-            case "F":
-                return self._with_debug(self._fight_round())
-            case "R":
-                return self._with_debug(self._run_attempt())
-            case "S":
-                self.awaiting_spell = True
-                return self._with_debug(
-                    EncounterResult(
-                        events=[Event.prompt("Choose a spell:", options=self._spell_menu())]
-                    )
-                )
-            case _:
-                return self._with_debug(
-                    EncounterResult(events=[Event.error("I don't understand that.")])
-                )
+            return self._with_debug(EncounterResult(events=[_EV_UNKNOWN_ERR]))
+        handler = self._COMMAND_HANDLERS.get(raw[0])
+        if handler is None:
+            return self._with_debug(EncounterResult(events=[_EV_UNKNOWN_ERR]))
+        return self._with_debug(handler(self))
+
+    def _start_spell_prompt(self) -> EncounterResult:
+        self.awaiting_spell = True
+        return EncounterResult(
+            events=[Event.prompt("Choose a spell:", options=self._spell_menu())]
+        )
 
     def _with_debug(self, result: EncounterResult) -> EncounterResult:
         if not self.debug:
@@ -126,52 +162,45 @@ class EncounterSession:
 
     def _fight_round(self) -> EncounterResult:
         events: list[Event] = []
-        level = self.monster_level
-        attack_score = (
-            20 + 5 * (11 - level) + self.player.dex + 3 * self.player.weapon_tier
-        )
-        roll = self.rng.randint(1, 100)
+        player = self.player
+        weapon_tier = player.weapon_tier
+        attack_score = self._base_score + player.dex + 3 * weapon_tier
+        bits = self._getrandbits(_FIGHT_BITS)
+        roll = (bits & 0xFFFF) % 100 + 1
         if self.debug:
             events.append(
                 Event.debug(
                     "DEBUG FIGHT: "
                     f"attack_score={attack_score} roll={roll} "
-                    f"weapon_tier={self.player.weapon_tier} str={self.player.str_} dex={self.player.dex}"
+                    f"weapon_tier={weapon_tier} str={player.str_} dex={player.dex}"
                 )
             )
         if roll > attack_score:
-            events.append(Event.combat(f"The {self.monster_name} evades your blow!"))
+            events.append(Event.combat(self._msg_evades))
         else:
             damage = max(
-                self.player.weapon_tier
-                + math.floor(self.player.str_ / 3)
-                + self.rng.randint(0, 4)
-                - 2,
+                weapon_tier + player.str_ // 3 + ((bits >> 16) & 0xFFFF) % 5 - 2,
                 1,
             )
-            self.vitality -= damage
-            events.append(Event.combat(f"You hit the {self.monster_name}!"))
+            vitality = self.vitality - damage
+            self.vitality = vitality
+            events.append(Event.combat(self._msg_you_hit))
             if self.debug:
-                events.append(
-                    Event.debug(f"DEBUG FIGHT: damage={damage} vitality={self.vitality}")
-                )
-            if self.vitality <= 0:
+                events.append(Event.debug(f"DEBUG FIGHT: damage={damage} vitality={vitality}"))
+            if vitality <= 0:
                 return self._handle_monster_death(events)
-            if self.rng.random() < 0.05 and self.player.weapon_tier > 0:
-                self.player.weapon_tier = 0
-                self.player.weapon_broken = True
-                events.append(Event.info("Your weapon breaks with the impact!"))
+            if bits >> 32 < _WEAPON_BREAK_ODDS and weapon_tier > 0:
+                player.weapon_tier = 0
+                player.weapon_broken = True
+                events.append(_EV_WEAPON_BREAKS)
 
-        attack_result = self._monster_attack()
-        events.extend(attack_result.events)
-        return EncounterResult(events=events, done=attack_result.done)
+        done = self._monster_attack(events)
+        return EncounterResult(events=events, done=done)
 
     def _run_attempt(self) -> EncounterResult:
         if self.player.fatigued:
-            return EncounterResult(
-                events=[Event.info("You are quite fatigued after your previous efforts.")]
-            )
-        if self.rng.random() < 0.4:
+            return EncounterResult(events=[_EV_FATIGUED])
+        if self._getrandbits(_ODDS_BITS) < _RUN_ESCAPE_ODDS:
             _reset_player_after_encounter(self.player)
             return EncounterResult(
                 events=[
@@ -196,46 +225,41 @@ class EncounterSession:
             ]
         )
 
-    def _monster_attack(self) -> EncounterResult:
-        events: list[Event] = []
-        level = self.monster_level
-        dodge_score = 20 + 5 * (11 - level) + 2 * self.player.dex
-        roll = self.rng.randint(1, 100)
+    def _monster_attack(self, events: list[Event]) -> bool:
+        # Appends to the caller's events; returns True if the player died.
+        player = self.player
+        randint = self._randint
+        dodge_score = self._base_score + 2 * player.dex
+        roll = randint(1, 100)
         if self.debug:
             events.append(
                 Event.debug(
                     "DEBUG MONSTER: "
                     f"dodge_score={dodge_score} roll={roll} "
-                    f"armor_tier={self.player.armor_tier} temp_armor_bonus={self.player.temp_armor_bonus}"
+                    f"armor_tier={player.armor_tier} temp_armor_bonus={player.temp_armor_bonus}"
                 )
             )
         if roll <= dodge_score:
-            events.append(Event.combat("You deftly dodge the blow!"))
-            return EncounterResult(events=events)
+            events.append(_EV_DODGE)
+            return False
 
-        armor = self.player.armor_tier + self.player.temp_armor_bonus
-        damage = max(
-            self.rng.randint(0, level - 1) + math.floor(2.5 + level / 3) - armor,
-            0,
-        )
-        self.player.hp -= damage
-        events.append(Event.combat(f"The {self.monster_name} hits you!"))
+        armor = player.armor_tier + player.temp_armor_bonus
+        damage = max(randint(0, self.monster_level - 1) + self._damage_base - armor, 0)
+        hp = player.hp - damage
+        player.hp = hp
+        events.append(Event.combat(self._msg_hits_you))
         if self.debug:
-            events.append(Event.debug(f"DEBUG MONSTER: damage={damage} hp={self.player.hp}"))
-        if self.player.hp <= 0:
-            events.append(Event.info("YOU HAVE DIED."))
-            return EncounterResult(events=events, done=True)
-        return EncounterResult(events=events)
+            events.append(Event.debug(f"DEBUG MONSTER: damage={damage} hp={hp}"))
+        if hp <= 0:
+            events.append(_EV_DEATH)
+            return True
+        return False
 
     def _handle_monster_death(self, events: list[Event]) -> EncounterResult:
-        events.append(Event.combat(f"The foul {self.monster_name} expires."))
-        if self.rng.random() > 0.7:
-            events.append(
-                Event.combat("As he dies, though, he launches one final desperate attack.")
-            )
-            attack_result = self._monster_attack()
-            events.extend(attack_result.events)
-            if attack_result.done:
+        events.append(Event.combat(self._msg_expires))
+        if self._getrandbits(_ODDS_BITS) < _FINAL_ATTACK_ODDS:
+            events.append(_EV_FINAL_ATTACK)
+            if self._monster_attack(events):
                 self.monster_level = 0
                 self.monster_name = ""
                 self.vitality = 0
@@ -249,112 +273,105 @@ class EncounterSession:
 
     def _handle_spell_choice(self, raw: str) -> EncounterResult:
         self.awaiting_spell = False
-        spell_map = {
-            "P": Spell.PROTECTION,
-            "F": Spell.FIREBALL,
-            "L": Spell.LIGHTNING,
-            "W": Spell.WEAKEN,
-            "T": Spell.TELEPORT,
-        }
-        spell = spell_map.get(raw[:1])
+        spell = _SPELL_KEYS.get(raw[0] if raw else "")
         if spell is None:
-            return EncounterResult(events=[Event.error("Choose P/F/L/W/T or Esc to cancel.")])
-        charges = self.player.spells.get(spell, 0)
+            return EncounterResult(events=[_EV_CHOOSE_SPELL])
+        charges = self.player.spells[spell]
         if self.player.iq < 12:
-            return EncounterResult(events=[Event.info("You have insufficient intelligence.")])
+            return EncounterResult(events=[_EV_IQ_TOO_LOW])
         if charges <= 0:
-            return EncounterResult(events=[Event.info("You know not that spell.")])
+            return EncounterResult(events=[_EV_SPELL_UNKNOWN])
 
         self.player.spells[spell] = charges - 1
         return self._cast_spell(spell)
 
     def _spell_menu(self) -> list[dict[str, object]]:
-        iq_too_low = self.player.iq < 12
-        spells = self.player.spells
+        player = self.player
+        iq_too_low = player.iq < 12
+        spells = player.spells
         return [
             {
-                "key": "P",
-                "label": f"Protection ({spells.get(Spell.PROTECTION, 0)})",
-                "disabled": iq_too_low or spells.get(Spell.PROTECTION, 0) <= 0,
-            },
-            {
-                "key": "F",
-                "label": f"Fireball ({spells.get(Spell.FIREBALL, 0)})",
-                "disabled": iq_too_low or spells.get(Spell.FIREBALL, 0) <= 0,
-            },
-            {
-                "key": "L",
-                "label": f"Lightning ({spells.get(Spell.LIGHTNING, 0)})",
-                "disabled": iq_too_low or spells.get(Spell.LIGHTNING, 0) <= 0,
-            },
-            {
-                "key": "W",
-                "label": f"Weaken ({spells.get(Spell.WEAKEN, 0)})",
-                "disabled": iq_too_low or spells.get(Spell.WEAKEN, 0) <= 0,
-            },
-            {
-                "key": "T",
-                "label": f"Teleport ({spells.get(Spell.TELEPORT, 0)})",
-                "disabled": iq_too_low or spells.get(Spell.TELEPORT, 0) <= 0,
-            },
+                "key": key,
+                "label": f"{label} ({spells[spell]})",
+                "disabled": iq_too_low or spells[spell] <= 0,
+            }
+            for key, spell, label in _SPELL_MENU
         ]
 
     def _cast_spell(self, spell: Spell) -> EncounterResult:
         events: list[Event] = []
-        match spell:
-            case Spell.PROTECTION:
-                self.player.temp_armor_bonus += 3
-                if self.player.armor_tier > 0:
-                    events.append(
-                        Event.info("Your armour glows briefly in response to your spell.")
-                    )
-                else:
-                    events.append(
-                        Event.info(
-                            "Your clothes glow briefly, becoming, temporarily, armour."
-                        )
-                    )
-            case Spell.FIREBALL:
-                roll = self.rng.randint(1, 5)
-                damage = roll + math.floor(self.player.iq / 3)
-                self.vitality -= damage
-                events.append(
-                    Event.combat(
-                        f"A glowing ball of fire converges with the {self.monster_name}."
-                    )
-                )
-            case Spell.LIGHTNING:
-                roll = self.rng.randint(1, 10)
-                damage = roll + math.floor(self.player.iq / 2)
-                self.vitality -= damage
-                events.append(Event.combat(f"The {self.monster_name} is thunderstruck!"))
-            case Spell.WEAKEN:
-                self.vitality = math.floor(self.vitality / 2)
-                events.append(
-                    Event.combat(
-                        f"A green mist envelops the {self.monster_name}, depriving him of half his vitality."
-                    )
-                )
-            case Spell.TELEPORT:
-                events.append(
-                    Event.info(
-                        "Thy surroundings vibrate momentarily, as you are magically transported elsewhere..."
-                    )
-                )
-                self.monster_level = 0
-                self.monster_name = ""
-                self.vitality = 0
-                _reset_player_after_encounter(self.player)
-                return EncounterResult(
-                    events=events,
-                    done=True,
-                    relocate=True,
-                    relocate_any_floor=False,
-                    enter_room=True,
-                )
+        result = self._SPELL_HANDLERS[spell](self, events)
+        if result is not None:
+            return result
 
         if self.vitality <= 0:
             return self._handle_monster_death(events)
-        attack_result = self._monster_attack()
-        events.extend(attack_result.events)
-        return EncounterResult(events=events, done=attack_result.done)
+        done = self._monster_attack(events)
+        return EncounterResult(events=events, done=done)
+
+    def _cast_protection(self, events: list[Event]) -> EncounterResult | None:
+        self.player.temp_armor_bonus += 3
+        if self.player.armor_tier > 0:
+            events.append(_EV_ARMOUR_GLOWS)
+        else:
+            events.append(_EV_CLOTHES_GLOW)
+        return None
+
+    def _cast_fireball(self, events: list[Event]) -> EncounterResult | None:
+        roll = self._randint(1, 5)
+        damage = roll + math.floor(self.player.iq / 3)
+        self.vitality -= damage
+        events.append(
+            Event.combat(f"A glowing ball of fire converges with the {self.monster_name}.")
+        )
+        return None
+
+    def _cast_lightning(self, events: list[Event]) -> EncounterResult | None:
+        roll = self._randint(1, 10)
+        damage = roll + math.floor(self.player.iq / 2)
+        self.vitality -= damage
+        events.append(Event.combat(f"The {self.monster_name} is thunderstruck!"))
+        return None
+
+    def _cast_weaken(self, events: list[Event]) -> EncounterResult | None:
+        self.vitality = math.floor(self.vitality / 2)
+        events.append(
+            Event.combat(
+                f"A green mist envelops the {self.monster_name}, depriving him of half his vitality."
+            )
+        )
+        return None
+
+    def _cast_teleport(self, events: list[Event]) -> EncounterResult | None:
+        events.append(
+            Event.info(
+                "Thy surroundings vibrate momentarily, as you are magically transported elsewhere..."
+            )
+        )
+        self.monster_level = 0
+        self.monster_name = ""
+        self.vitality = 0
+        _reset_player_after_encounter(self.player)
+        return EncounterResult(
+            events=events,
+            done=True,
+            relocate=True,
+            relocate_any_floor=False,
+            enter_room=True,
+        )
+
+    # Handlers return a result to end the turn early, or None to let the
+    # monster respond.
+    _SPELL_HANDLERS = {
+        Spell.PROTECTION: _cast_protection,
+        Spell.FIREBALL: _cast_fireball,
+        Spell.LIGHTNING: _cast_lightning,
+        Spell.WEAKEN: _cast_weaken,
+        Spell.TELEPORT: _cast_teleport,
+    }
+
+    _COMMAND_HANDLERS = {
+        "F": _fight_round,
+        "R": _run_attempt,
+        "S": _start_spell_prompt,
+    }
@@ -3,10 +3,9 @@ from __future__ import annotations
 import random
 
 from dungeon.constants import (
-    ARMOR_NAMES,
-    EXPLORE_COMMANDS,
     FEATURE_SYMBOLS,
     MONSTER_NAMES,
+    SIZE,
     TREASURE_NAMES,
     Feature,
     Mode,
@@ -14,20 +13,87 @@ from dungeon.constants import (
 )
 from dungeon.encounter import EncounterSession
 from dungeon.generation import generate_dungeon
-from dungeon.model import Player
+from dungeon.model import Player, Room
 from dungeon.potions import drink_attribute_potion_events, drink_healing_potion_events
 from dungeon.types import Event, StepResult
 from dungeon.vendor import VendorSession
 
 
-def _pluralize(count: int, singular: str, plural: str | None = None) -> str:
-    suffix = plural if plural is not None else f"{singular}s"
-    return singular if count == 1 else suffix
+_HELP_TEXT = (
+    "COMMAND SUMMARY:\n"
+    "Move: N=North  S=South  E=East  W=West  U=Up  D=Down\n"
+    "Act:  L=Look  O=Open chest  R=Read scroll  P=Potion  F=Flare  B=Buy\n"
+    "Info: H=Help  X=eXit\n"
+    "\n"
+    "Encounter: F=Fight  R=Run  S=Spell\n"
+    "\n"
+    "MAP LEGEND:\n"
+    "-=Empty  m=Mirror  s=Scroll  c=Chest  f=Flares  p=Potion\n"
+    "v=Vendor  t=Thief  w=Warp  U=Up  D=Down  X=eXit\n"
+    "T=Treasure  M=Monster  *=You  ·=Unknown"
+)
+
+# What a room shows on entry, for features that just sit there.
+_FEATURE_INFO = {
+    Feature.MIRROR: Event.info("There is a magic mirror mounted on the wall here."),
+    Feature.SCROLL: Event.info("There is a spell scroll here."),
+    Feature.CHEST: Event.info("There is a chest here."),
+    Feature.POTION: Event.info("There is a magic potion here."),
+    Feature.VENDOR: Event.info("There is a vendor here. Do you wish to purchase something?"),
+    Feature.STAIRS_UP: Event.info("There are stairs up here."),
+    Feature.STAIRS_DOWN: Event.info("There are stairs down here."),
+    Feature.EXIT: Event.info("You see the exit to the DUNGEON of DOOM here."),
+}
+_EV_EMPTY_ROOM = Event.info("This room is empty.")
+
+_EV_UNKNOWN_ERR = Event.error("I don't understand that.")
+_EV_UNKNOWN_INFO = Event.info("I don't understand that.")
+_EV_HELP = Event.info(_HELP_TEXT)
+_EV_WALL = Event.info("A wall interposes itself.")
+_EV_NO_STAIRS_UP = Event.info("There are no stairs leading up here, foolish adventurer.")
+_EV_NO_STAIRS_DOWN = Event.info(
+    "There is no downward staircase here, so how do you propose to go down?"
+)
+_EV_NO_EXIT = Event.info("There is no exit here.")
+_EV_NO_FLARES = Event.info("Thou hast no flares.")
+_EV_NO_MIRROR = Event.info("There is no mirror here.")
+_EV_NO_CHEST = Event.info("There is no chest here.")
+_EV_NO_SCROLL = Event.info("Sorry. There is nothing to read here.")
+_EV_NO_POTION = Event.info("There is no potion here, I fear.")
+_EV_NO_VENDOR = Event.info("There is no vendor here.")
+_EV_FLARES_FOUND = Event.info("You pick up some flares here.")
+_EV_WARP = Event.info(
+    "This room contains a warp. Before you realize what is going on, "
+    "you appear elsewhere..."
+)
+_EV_FLARE_LIT = Event.info("The flare illuminates nearby rooms.")
+_EV_MIRROR_CLOUDY = Event.info("The mirror is cloudy and yields no vision.")
+_EV_CHEST_EMPTY = Event.info("It containeth naught.")
+_EV_CHEST_ARMOUR_DESTROYED = Event.info(
+    "The perverse thing explodes as you open it, destroying your armour!"
+)
+_EV_CHEST_ARMOUR_DAMAGED = Event.info(
+    "The perverse thing explodes as you open it, damaging your armour!"
+)
+_EV_CHEST_WOUNDS = Event.info("The perverse thing explodes as you open it, wounding you!")
+_EV_DEATH = Event.info("YOU HAVE DIED.")
+_EV_QUEST_ABANDONED = Event.info(
+    "What? And hast thou abandoned thy quest before it was accomplished?"
+)
+_EV_VICTORY = Event.info("ALL HAIL THE VICTOR!")
+_POTION_TARGETS = ("STR", "DEX", "IQ", "MHP")
+_MIRROR_VISIONS = (
+    _EV_MIRROR_CLOUDY,
+    Event.info("You see yourself dead and lying in a black coffin."),
+    Event.info("You see a dragon beckoning to you."),
+    Event.info("You see the three heads of a chimaera grinning at you."),
+    Event.info("You see the exit on the 7th floor, big and friendly-looking."),
+)
 
 
 class Game:
-    SIZE = 7
-    SAVE_VERSION = 1
+    SIZE = SIZE
+    SAVE_VERSION = 4
 
     def __init__(
         self,
@@ -44,6 +110,9 @@ class Game:
         self._end_mode: Mode | None = None
         self._encounter_session: EncounterSession | None = None
         self._shop_session: VendorSession | None = None
+        # Spare random bits left over from the last getrandbits(64) refill.
+        self._bit_pool = 0
+        self._bit_count = 0
         self.debug = debug
 
     @property
@@ -58,17 +127,22 @@ class Game:
         return self._enter_room()
 
     def step(self, command: str) -> StepResult:
-        raw = command.strip().upper()
+        # Single keystrokes are the common case and need no stripping.
+        if len(command) == 1 and not command.isspace():
+            raw = command.upper()
+        else:
+            raw = command.strip().upper()
         if not raw:
             return StepResult(
-                events=[Event.error("I don't understand that.")],
+                events=[_EV_UNKNOWN_ERR],
                 mode=self.mode,
                 needs_input=True,
             )
-        if self.mode in {Mode.GAME_OVER, Mode.VICTORY}:
+        end_mode = self._end_mode
+        if end_mode is not None:
             return StepResult(
-                events=[Event.error("I don't understand that.")],
-                mode=self.mode,
+                events=[_EV_UNKNOWN_ERR],
+                mode=end_mode,
                 needs_input=False,
             )
 
@@ -83,42 +157,45 @@ class Game:
             events = result.events
             if result.done:
                 self._encounter_session = None
+                player = self.player
                 if result.defeated_monster:
                     room = self._current_room()
                     monster_level = room.monster_level
                     room.monster_level = 0
-                    if self.player.hp > 0:
+                    if player.hp > 0:
                         if room.treasure_id:
-                            events.extend(self._award_treasure(room.treasure_id))
+                            self._award_treasure(room.treasure_id, events)
                             room.treasure_id = 0
                         else:
                             gold = 5 * monster_level + self.rng.randint(0, 20)
-                            self.player.gold += gold
+                            player.gold += gold
                             events.append(
                                 Event.loot(
-                                    f"You find {gold} gold {_pluralize(gold, 'piece')}."
+                                    f"You find {gold} gold "
+                                    f"{'piece' if gold == 1 else 'pieces'}."
                                 )
                             )
                 if result.relocate:
                     self._random_relocate(any_floor=result.relocate_any_floor)
                     if result.enter_room:
-                        events.extend(self._enter_room())
-                if self.player.hp <= 0:
+                        self._enter_room(events)
+                if player.hp <= 0:
                     self._end_mode = Mode.GAME_OVER
             return StepResult(events=events, mode=self.mode, needs_input=True)
 
-        key = raw[0]
-        if key not in EXPLORE_COMMANDS:
+        handler = self._EXPLORE_HANDLERS.get(raw[0])
+        if handler is None:
             return StepResult(
-                events=[Event.error("I don't understand that.")],
+                events=[_EV_UNKNOWN_ERR],
                 mode=self.mode,
                 needs_input=True,
             )
-        return StepResult(events=self._handle_explore(key), mode=self.mode, needs_input=True)
+        return StepResult(events=handler(self), mode=self.mode, needs_input=True)
 
     def attempt_cancel(self) -> StepResult:
-        if self.mode in {Mode.GAME_OVER, Mode.VICTORY}:
-            return StepResult(events=[], mode=self.mode, needs_input=False)
+        end_mode = self._end_mode
+        if end_mode is not None:
+            return StepResult(events=[], mode=end_mode, needs_input=False)
         if self._shop_session:
             result = self._shop_session.attempt_cancel()
             if result.done:
@@ -134,10 +211,10 @@ class Game:
             if result.relocate:
                 self._random_relocate(any_floor=result.relocate_any_floor)
                 if result.enter_room:
-                    events.extend(self._enter_room())
+                    self._enter_room(events)
             return StepResult(events=events, mode=self.mode, needs_input=True)
         return StepResult(
-            events=[Event.info("I don't understand that.")],
+            events=[_EV_UNKNOWN_INFO],
             mode=self.mode,
             needs_input=True,
         )
@@ -152,15 +229,16 @@ class Game:
     def status_events(self) -> list[Event]:
         events = [Event.status(self._status_data())]
         if self.debug:
+            player = self.player
             events.append(
                 Event.debug(
                     "DEBUG STATS: "
-                    f"weapon_tier={self.player.weapon_tier} "
-                    f"armor_tier={self.player.armor_tier} "
-                    f"weapon_broken={self.player.weapon_broken} "
-                    f"armor_damaged={self.player.armor_damaged} "
-                    f"temp_armor_bonus={self.player.temp_armor_bonus} "
-                    f"fatigued={self.player.fatigued}"
+                    f"weapon_tier={player.weapon_tier} "
+                    f"armor_tier={player.armor_tier} "
+                    f"weapon_broken={player.weapon_broken} "
+                    f"armor_damaged={player.armor_damaged} "
+                    f"temp_armor_bonus={player.temp_armor_bonus} "
+                    f"fatigued={player.fatigued}"
                 )
             )
         return events
@@ -168,7 +246,7 @@ class Game:
     def resume_events(self) -> list[Event]:
         if self._shop_session:
             return [
-                Event.info("There is a vendor here. Do you wish to purchase something?"),
+                _FEATURE_INFO[Feature.VENDOR],
                 *self._shop_session.resume_events(),
             ]
         if self._encounter_session:
@@ -176,154 +254,116 @@ class Game:
         return self._describe_room(self._current_room())
 
     def _current_room(self):
-        return self.dungeon.rooms[self.player.z][self.player.y][self.player.x]
-
-    def _handle_explore(self, key: str) -> list[Event]:
-        match key:
-            case "N":
-                return self._move(-1, 0)
-            case "S":
-                return self._move(1, 0)
-            case "E":
-                return self._move(0, 1)
-            case "W":
-                return self._move(0, -1)
-            case "U":
-                return self._stairs_up()
-            case "D":
-                return self._stairs_down()
-            case "F":
-                return self._use_flare()
-            case "X":
-                return self._attempt_exit()
-            case "L":
-                return self._use_mirror()
-            case "O":
-                return self._open_chest()
-            case "R":
-                return self._read_scroll()
-            case "P":
-                return self._drink_potion()
-            case "B":
-                return self._open_vendor()
-            case "H":
-                return [Event.info(self._help_text())]
-            case _:
-                return []
+        player = self.player
+        return self.dungeon.floors[player.z][player.y * SIZE + player.x]
 
     def _move(self, dy: int, dx: int) -> list[Event]:
-        ny = self.player.y + dy
-        nx = self.player.x + dx
-        if ny < 0 or ny >= self.SIZE or nx < 0 or nx >= self.SIZE:
-            return [Event.info("A wall interposes itself.")]
-        self.player.y = ny
-        self.player.x = nx
+        player = self.player
+        ny = player.y + dy
+        nx = player.x + dx
+        if not (0 <= ny < SIZE and 0 <= nx < SIZE):
+            return [_EV_WALL]
+        player.y = ny
+        player.x = nx
         return self._enter_room()
 
     def _stairs_up(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.STAIRS_UP:
-            return [Event.info("There are no stairs leading up here, foolish adventurer.")]
+            return [_EV_NO_STAIRS_UP]
         self.player.z += 1
         return self._enter_room()
 
     def _stairs_down(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.STAIRS_DOWN:
-            return [
-                Event.info(
-                    "There is no downward staircase here, so how do you propose to go down?"
-                )
-            ]
+            return [_EV_NO_STAIRS_DOWN]
         self.player.z -= 1
         return self._enter_room()
 
-    def _enter_room(self) -> list[Event]:
-        events: list[Event] = []
-        room = self._current_room()
-        room.seen = True
+    def _enter_room(self, events: list[Event] | None = None) -> list[Event]:
+        # Appends to the caller's list when given, so chained entries (warps,
+        # post-encounter relocation) share one list.
+        if events is None:
+            events = []
+        player = self.player
+        floors = self.dungeon.floors
+        while True:
+            room = floors[player.z][player.y * SIZE + player.x]
+            room.seen = True
+
+            if room.monster_level > 0:
+                self._encounter_session = EncounterSession.start(
+                    rng=self.rng,
+                    player=player,
+                    monster_level=room.monster_level,
+                    debug=self.debug,
+                )
+                events.extend(self._encounter_session.start_events())
+                return events
 
-        if room.monster_level > 0:
-            self._encounter_session = EncounterSession.start(
-                rng=self.rng,
-                player=self.player,
-                monster_level=room.monster_level,
-                debug=self.debug,
-            )
-            return self._encounter_session.start_events()
+            if room.treasure_id:
+                self._award_treasure(room.treasure_id, events)
+                room.treasure_id = 0
 
-        if room.treasure_id:
-            events.extend(self._award_treasure(room.treasure_id))
-            room.treasure_id = 0
-
-        match room.feature:
-            case Feature.FLARES:
-                gained = self.rng.randint(1, 5)
-                self.player.flares += gained
-                room.feature = Feature.EMPTY
-                events.append(Event.info("You pick up some flares here."))
-            case Feature.THIEF:
-                stolen = min(self.rng.randint(1, 50), self.player.gold)
-                self.player.gold -= stolen
-                room.feature = Feature.EMPTY
-                events.append(
-                    Event.info(
-                        f"A thief sneaks from the shadows and removes {stolen} gold "
-                        f"{_pluralize(stolen, 'piece')} from your possession."
-                    )
-                )
-            case Feature.WARP:
-                events.append(
-                    Event.info(
-                        "This room contains a warp. Before you realize what is going on, "
-                        "you appear elsewhere..."
-                    )
-                )
-                self._random_relocate(any_floor=True)
-                events.extend(self._enter_room())
-            case _:
-                events.extend(self._describe_room(room))
+            if room.feature != Feature.WARP:
+                break
+            events.append(_EV_WARP)
+            self._random_relocate(any_floor=True)
+
+        handler = self._ENTER_HANDLERS.get(room.feature)
+        if handler is None:
+            self._describe_room(room, events)
+        else:
+            handler(self, room, events)
         return events
 
-    def _describe_room(self, room) -> list[Event]:
-        events: list[Event] = []
+    def _enter_flares(self, room: Room, events: list[Event]) -> None:
+        gained = self.rng.randint(1, 5)
+        self.player.flares += gained
+        room.feature = Feature.EMPTY
+        events.append(_EV_FLARES_FOUND)
+
+    def _enter_thief(self, room: Room, events: list[Event]) -> None:
+        stolen = min(self.rng.randint(1, 50), self.player.gold)
+        self.player.gold -= stolen
+        room.feature = Feature.EMPTY
+        events.append(
+            Event.info(
+                f"A thief sneaks from the shadows and removes {stolen} gold "
+                f"{'piece' if stolen == 1 else 'pieces'} from your possession."
+            )
+        )
+
+    # Features that act on the player as they walk in (warps are handled by
+    # the entry loop); any other room is just described.
+    _ENTER_HANDLERS = {
+        Feature.FLARES: _enter_flares,
+        Feature.THIEF: _enter_thief,
+    }
+
+    def _describe_room(self, room, events: list[Event] | None = None) -> list[Event]:
+        if events is None:
+            events = []
         if room.monster_level > 0:
             name = MONSTER_NAMES[room.monster_level - 1]
-            return [Event.combat(f"You are facing an angry {name}!")]
+            events.append(Event.combat(f"You are facing an angry {name}!"))
+            return events
         if room.treasure_id:
             events.append(Event.loot(f"You find the {self._treasure_name(room.treasure_id)}!"))
-        match room.feature:
-            case Feature.MIRROR:
-                events.append(Event.info("There is a magic mirror mounted on the wall here."))
-            case Feature.SCROLL:
-                events.append(Event.info("There is a spell scroll here."))
-            case Feature.CHEST:
-                events.append(Event.info("There is a chest here."))
-            case Feature.POTION:
-                events.append(Event.info("There is a magic potion here."))
-            case Feature.VENDOR:
-                events.append(
-                    Event.info("There is a vendor here. Do you wish to purchase something?")
-                )
-            case Feature.STAIRS_UP:
-                events.append(Event.info("There are stairs up here."))
-            case Feature.STAIRS_DOWN:
-                events.append(Event.info("There are stairs down here."))
-            case Feature.EXIT:
-                events.append(Event.info("You see the exit to the DUNGEON of DOOM here."))
-            case _:
-                events.append(Event.info("This room is empty."))
+        events.append(_FEATURE_INFO.get(room.feature, _EV_EMPTY_ROOM))
         return events
 
     def _attempt_exit(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.EXIT:
-            return [Event.info("There is no exit here.")]
-        if len(self.player.treasures_found) < 10:
+            return [_EV_NO_EXIT]
+        found = self.player.treasures_count
+        if found < 10:
             self._end_mode = Mode.GAME_OVER
-            remaining = 10 - len(self.player.treasures_found)
+            remaining = 10 - found
             return [
-                Event.info("What? And hast thou abandoned thy quest before it was accomplished?"),
+                _EV_QUEST_ABANDONED,
                 Event.info(
                     "The DUNGEON of DOOM still holds "
                     f"{remaining} treasures that thine eyes shall never behold! "
@@ -331,113 +371,96 @@ class Game:
                 ),
             ]
         self._end_mode = Mode.VICTORY
-        return [Event.info("ALL HAIL THE VICTOR!")]
+        return [_EV_VICTORY]
 
     def _use_flare(self) -> list[Event]:
-        if self.player.flares < 1:
-            return [Event.info("Thou hast no flares.")]
-        self.player.flares -= 1
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dy == 0 and dx == 0:
-                    continue
-                ny = self.player.y + dy
-                nx = self.player.x + dx
-                if ny >= 0 and ny < self.SIZE and nx >= 0 and nx < self.SIZE:
-                    self.dungeon.rooms[self.player.z][ny][nx].seen = True
-        return [Event.info("The flare illuminates nearby rooms.")]
+        player = self.player
+        if player.flares < 1:
+            return [_EV_NO_FLARES]
+        player.flares -= 1
+        floor = self.dungeon.floors[player.z]
+        # Clip the 3x3 block to the floor once, then light every room in it.
+        # This includes the player's own room, which is already seen.
+        left = max(player.x - 1, 0)
+        right = min(player.x + 2, SIZE)
+        for ny in range(max(player.y - 1, 0), min(player.y + 2, SIZE)):
+            for room in floor[ny * SIZE + left : ny * SIZE + right]:
+                room.seen = True
+        return [_EV_FLARE_LIT]
 
     def _map_grid(self) -> list[str]:
         grid: list[str] = []
-        for y in range(self.SIZE):
-            row: list[str] = []
-            for x in range(self.SIZE):
-                room = self.dungeon.rooms[self.player.z][y][x]
-                if self.player.y == y and self.player.x == x:
-                    row.append("*")
+        player = self.player
+        floor = self.dungeon.floors[player.z]
+        here = player.y * SIZE + player.x
+        # One reusable row buffer with the separators already in place; each
+        # cell writes to every other slot.
+        row = [" "] * (2 * SIZE - 1)
+        for start in range(0, SIZE * SIZE, SIZE):
+            col = 0
+            for i in range(start, start + SIZE):
+                room = floor[i]
+                if i == here:
+                    row[col] = "*"
                 elif not room.seen:
-                    row.append("·")
+                    row[col] = "·"
                 elif room.monster_level > 0:
-                    row.append("M")
+                    row[col] = "M"
                 elif room.treasure_id:
-                    row.append("T")
+                    row[col] = "T"
                 else:
-                    row.append(FEATURE_SYMBOLS.get(room.feature, "-"))
-            grid.append(" ".join(row))
+                    row[col] = FEATURE_SYMBOLS[room.feature]
+                col += 2
+            grid.append("".join(row))
         return grid
 
     def _status_data(self) -> dict[str, int | str]:
+        player = self.player
+        spells = player.spells
         return {
-            "gold": self.player.gold,
-            "treasures": len(self.player.treasures_found),
-            "flares": self.player.flares,
-            "protection": self.player.spells.get(Spell.PROTECTION, 0),
-            "fireball": self.player.spells.get(Spell.FIREBALL, 0),
-            "lightning": self.player.spells.get(Spell.LIGHTNING, 0),
-            "weaken": self.player.spells.get(Spell.WEAKEN, 0),
-            "teleport": self.player.spells.get(Spell.TELEPORT, 0),
+            "gold": player.gold,
+            "treasures": player.treasures_count,
+            "flares": player.flares,
+            "protection": spells[Spell.PROTECTION],
+            "fireball": spells[Spell.FIREBALL],
+            "lightning": spells[Spell.LIGHTNING],
+            "weaken": spells[Spell.WEAKEN],
+            "teleport": spells[Spell.TELEPORT],
             "armor": self._armor_display_name(),
-            "weapon": self.player.weapon_name,
-            "str": self.player.str_,
-            "dex": self.player.dex,
-            "iq": self.player.iq,
-            "hp": self.player.hp,
-            "mhp": self.player.mhp,
+            "weapon": player.weapon_name,
+            "str": player.str_,
+            "dex": player.dex,
+            "iq": player.iq,
+            "hp": player.hp,
+            "mhp": player.mhp,
         }
 
-    def _help_text(self) -> str:
-        return (
-            "COMMAND SUMMARY:\n"
-            "Move: N=North  S=South  E=East  W=West  U=Up  D=Down\n"
-            "Act:  L=Look  O=Open chest  R=Read scroll  P=Potion  F=Flare  B=Buy\n"
-            "Info: H=Help  X=eXit\n"
-            "\n"
-            "Encounter: F=Fight  R=Run  S=Spell\n"
-            "\n"
-            "MAP LEGEND:\n"
-            "-=Empty  m=Mirror  s=Scroll  c=Chest  f=Flares  p=Potion\n"
-            "v=Vendor  t=Thief  w=Warp  U=Up  D=Down  X=eXit\n"
-            "T=Treasure  M=Monster  *=You  ·=Unknown"
-        )
-
     def _use_mirror(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.MIRROR:
-            return [Event.info("There is no mirror here.")]
+            return [_EV_NO_MIRROR]
         events: list[Event] = []
-        if len(self.player.treasures_found) == 10:
-            events.append(Event.info("The mirror is cloudy and yields no vision."))
-        elif self.rng.randint(1, 50) > self.player.iq:
-            visions = [
-                "The mirror is cloudy and yields no vision.",
-                "You see yourself dead and lying in a black coffin.",
-                "You see a dragon beckoning to you.",
-                "You see the three heads of a chimaera grinning at you.",
-                "You see the exit on the 7th floor, big and friendly-looking.",
-            ]
-            if self.rng.randint(1, 10) <= 5:
-                events.append(Event.info(self.rng.choice(visions)))
+        player = self.player
+        if player.treasures_count == 10:
+            events.append(_EV_MIRROR_CLOUDY)
+        elif self.rng.randint(1, 50) > player.iq:
+            draw = self._draw_below
+            if draw(2, 1):
+                events.append(_MIRROR_VISIONS[draw(len(_MIRROR_VISIONS), 3)])
             else:
-                treasure = self.rng.randint(1, 10)
-                tx = self.rng.randint(1, self.SIZE)
-                ty = self.rng.randint(1, self.SIZE)
-                tz = self.rng.randint(1, self.SIZE)
+                treasure = draw(10, 4) + 1
+                tx = draw(SIZE, 3) + 1
+                ty = draw(SIZE, 3) + 1
+                tz = draw(SIZE, 3) + 1
                 events.append(
                     Event.info(f"You see the {self._treasure_name(treasure)} at {tz},{ty},{tx}!")
                 )
         else:
-            locations = [
-                (candidate.treasure_id, z, y, x)
-                for z, floor in enumerate(self.dungeon.rooms)
-                for y, row in enumerate(floor)
-                for x, candidate in enumerate(row)
-                if candidate.treasure_id
-                and candidate.treasure_id not in self.player.treasures_found
-            ]
+            locations = list(self.dungeon.treasure_locations.items())
             if not locations:
-                events.append(Event.info("The mirror is cloudy and yields no vision."))
+                events.append(_EV_MIRROR_CLOUDY)
             else:
-                treasure, z, y, x = self.rng.choice(locations)
+                treasure, (z, y, x) = self.rng.choice(locations)
                 events.append(
                     Event.info(
                         f"You see the {self._treasure_name(treasure)} at {z + 1},{y + 1},{x + 1}!"
@@ -449,72 +472,63 @@ class Game:
     def _open_chest(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.CHEST:
-            return [Event.info("There is no chest here.")]
+            return [_EV_NO_CHEST]
         room.feature = Feature.EMPTY
-        roll = self.rng.randint(1, 10)
+        player = self.player
+        randint = self.rng.randint
+        roll = randint(1, 10)
         if roll == 1:
-            if self.player.armor_tier > 0:
-                self.player.armor_tier -= 1
-                if self.player.armor_tier == 0:
-                    self.player.armor_name = ARMOR_NAMES[0]
-                    self.player.armor_damaged = False
-                    return [
-                        Event.info(
-                            "The perverse thing explodes as you open it, destroying your armour!"
-                        )
-                    ]
-                self.player.armor_damaged = True
-                return [
-                    Event.info(
-                        "The perverse thing explodes as you open it, damaging your armour!"
-                    )
-                ]
-            self.player.armor_name = ARMOR_NAMES[0]
-            self.player.armor_damaged = False
-            self.player.hp -= self.rng.randint(0, 4) + 3
-            if self.player.hp <= 0:
+            if player.armor_tier > 1:
+                player.armor_tier -= 1
+                player.armor_damaged = True
+                return [_EV_CHEST_ARMOUR_DAMAGED]
+            if player.armor_tier == 1:
+                player.equip_armor(0)
+                return [_EV_CHEST_ARMOUR_DESTROYED]
+            player.equip_armor(0)
+            player.hp -= randint(0, 4) + 3
+            if player.hp <= 0:
                 self._end_mode = Mode.GAME_OVER
-                return [
-                    Event.info("The perverse thing explodes as you open it, wounding you!"),
-                    Event.info("YOU HAVE DIED."),
-                ]
-            return [Event.info("The perverse thing explodes as you open it, wounding you!")]
+                return [_EV_CHEST_WOUNDS, _EV_DEATH]
+            return [_EV_CHEST_WOUNDS]
         if roll in {2, 3, 4}:
-            return [Event.info("It containeth naught.")]
-        gold = 10 + self.rng.randint(0, 20)
-        self.player.gold += gold
-        return [Event.info(f"You find {gold} gold {_pluralize(gold, 'piece')}!")]
+            return [_EV_CHEST_EMPTY]
+        gold = 10 + randint(0, 20)
+        player.gold += gold
+        return [Event.info(f"You find {gold} gold {'piece' if gold == 1 else 'pieces'}!")]
 
     def _read_scroll(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.SCROLL:
-            return [Event.info("Sorry. There is nothing to read here.")]
+            return [_EV_NO_SCROLL]
         room.feature = Feature.EMPTY
         spell = Spell(self.rng.randint(1, 5))
-        self.player.spells[spell] = self.player.spells.get(spell, 0) + 1
+        self.player.spells[spell] += 1
         return [Event.info(f"The scroll contains the {spell.name.lower()} spell.")]
 
     def _drink_potion(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.POTION:
-            return [Event.info("There is no potion here, I fear.")]
+            return [_EV_NO_POTION]
         room.feature = Feature.EMPTY
-        roll = self.rng.randint(1, 5)
+        player = self.player
+        rng = self.rng
+        roll = rng.randint(1, 5)
         if roll == 1:
-            heal = 5 + self.rng.randint(1, 10)
-            self.player.hp = min(self.player.mhp, self.player.hp + heal)
+            heal = 5 + rng.randint(1, 10)
+            player.hp = min(player.mhp, player.hp + heal)
             return drink_healing_potion_events()
-        effect = self.rng.choice(["STR", "DEX", "IQ", "MHP"])
-        change = self.rng.randint(1, 3)
-        if self.rng.random() > 0.5:
+        effect = rng.choice(_POTION_TARGETS)
+        change = rng.randint(1, 3)
+        if rng.random() > 0.5:
             change = -change
-        self.player.apply_attribute_change(target=effect, change=change)
+        player.apply_attribute_change(target=effect, change=change)
         return drink_attribute_potion_events(target=effect, change=change)
 
     def _open_vendor(self) -> list[Event]:
         room = self._current_room()
         if room.feature != Feature.VENDOR:
-            return [Event.info("There is no vendor here.")]
+            return [_EV_NO_VENDOR]
         self._shop_session = VendorSession(rng=self.rng, player=self.player)
         return self._shop_session.start_events()
 
@@ -523,23 +537,51 @@ class Game:
             return f"{self.player.armor_name} (damaged)"
         return self.player.armor_name
 
+    def _draw_below(self, limit: int, bits: int) -> int:
+        # Uniform draw in [0, limit) from the shared bit pool, rejecting values
+        # that fall outside the range; limit must not exceed 1 << bits.
+        while True:
+            if self._bit_count < bits:
+                self._bit_pool = self.rng.getrandbits(64)
+                self._bit_count = 64
+            value = self._bit_pool & ((1 << bits) - 1)
+            self._bit_pool >>= bits
+            self._bit_count -= bits
+            if value < limit:
+                return value
+
     def _random_relocate(self, *, any_floor: bool) -> None:
         if any_floor:
-            self.player.z = self.rng.randrange(self.SIZE)
-        while True:
-            ny = self.rng.randrange(self.SIZE)
-            nx = self.rng.randrange(self.SIZE)
-            if ny == self.player.y and nx == self.player.x:
-                continue
-            self.player.y = ny
-            self.player.x = nx
-            return
-
-    def _award_treasure(self, treasure_id: int) -> list[Event]:
-        if treasure_id in self.player.treasures_found:
-            return []
-        self.player.treasures_found.add(treasure_id)
-        return [Event.loot(f"You find the {self._treasure_name(treasure_id)}!")]
+            self.player.z = self._draw_below(SIZE, 3)
+        # Pick one of the other 48 cells directly: skip over the current one.
+        here = self.player.y * SIZE + self.player.x
+        index = self._draw_below(SIZE * SIZE - 1, 6)
+        if index >= here:
+            index += 1
+        self.player.y, self.player.x = divmod(index, SIZE)
+
+    def _award_treasure(self, treasure_id: int, events: list[Event]) -> None:
+        self.dungeon.treasure_locations.pop(treasure_id, None)
+        if self.player.add_treasure(treasure_id):
+            events.append(Event.loot(f"You find the {self._treasure_name(treasure_id)}!"))
 
     def _treasure_name(self, treasure_id: int) -> str:
         return TREASURE_NAMES[treasure_id - 1]
+
+    # One handler per EXPLORE_COMMANDS letter.
+    _EXPLORE_HANDLERS = {
+        "N": lambda game: game._move(-1, 0),
+        "S": lambda game: game._move(1, 0),
+        "E": lambda game: game._move(0, 1),
+        "W": lambda game: game._move(0, -1),
+        "U": _stairs_up,
+        "D": _stairs_down,
+        "F": _use_flare,
+        "X": _attempt_exit,
+        "L": _use_mirror,
+        "O": _open_chest,
+        "R": _read_scroll,
+        "P": _drink_potion,
+        "B": _open_vendor,
+        "H": lambda game: [_EV_HELP],
+    }
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import random
 
-from dungeon.constants import Feature
+from dungeon.constants import SIZE, Feature
 from dungeon.model import Dungeon, Room
 
-_SIZE = 7
+# Features that must sit alone in an otherwise empty room.
+_FIXED_FEATURES = frozenset({Feature.STAIRS_UP, Feature.STAIRS_DOWN, Feature.EXIT})
 
 
 def generate_dungeon(rng: random.Random) -> Dungeon:
     rooms = [
-        [[_create_room(rng, z) for _x in range(_SIZE)] for _y in range(_SIZE)]
-        for z in range(_SIZE)
+        [[_create_room(rng, z) for _x in range(SIZE)] for _y in range(SIZE)]
+        for z in range(SIZE)
     ]
     _place_treasures(rng, rooms)
     _place_stairs(rng, rooms)
@@ -35,9 +36,9 @@ def _create_room(rng: random.Random, floor: int) -> Room:
 def _place_treasures(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
     placed = 0
     while placed < 10:
-        z = rng.randrange(_SIZE)
-        y = rng.randrange(_SIZE)
-        x = rng.randrange(_SIZE)
+        z = rng.randrange(SIZE)
+        y = rng.randrange(SIZE)
+        x = rng.randrange(SIZE)
         room = rooms[z][y][x]
         if room.treasure_id != 0:
             continue
@@ -48,10 +49,10 @@ def _place_treasures(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
 
 
 def _place_stairs(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
-    for z in range(_SIZE - 1):
+    for z in range(SIZE - 1):
         while True:
-            y = rng.randrange(_SIZE)
-            x = rng.randrange(_SIZE)
+            y = rng.randrange(SIZE)
+            x = rng.randrange(SIZE)
             room = rooms[z][y][x]
             room_below = rooms[z + 1][y][x]
             if room.treasure_id > 0 or room.monster_level > 0:
@@ -66,14 +67,14 @@ def _place_stairs(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
 
 
 def _place_exit(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
-    z = _SIZE - 1
+    z = SIZE - 1
     while True:
-        y = rng.randrange(_SIZE)
-        x = rng.randrange(_SIZE)
+        y = rng.randrange(SIZE)
+        x = rng.randrange(SIZE)
         room = rooms[z][y][x]
         if room.treasure_id > 0 or room.monster_level > 0:
             continue
-        if room.feature in {Feature.STAIRS_UP, Feature.STAIRS_DOWN, Feature.EXIT}:
+        if room.feature in _FIXED_FEATURES:
             continue
         room.feature = Feature.EXIT
         break
@@ -81,33 +82,35 @@ def _place_exit(rng: random.Random, rooms: list[list[list[Room]]]) -> None:
 
 def validate_dungeon(dungeon: Dungeon) -> list[str]:
     errors: list[str] = []
-    if len(dungeon.rooms) != _SIZE:
+    if len(dungeon.rooms) != SIZE:
         return ["Dungeon has incorrect number of floors."]
 
     exit_count = 0
     treasure_count = 0
-    stairs_up_counts = [0] * _SIZE
-    stairs_down_counts = [0] * _SIZE
+    treasures: dict[int, tuple[int, int, int]] = {}
+    stairs_up_counts = [0] * SIZE
+    stairs_down_counts = [0] * SIZE
 
-    for z in range(_SIZE):
-        for y in range(_SIZE):
-            if len(dungeon.rooms[z][y]) != _SIZE:
+    for z in range(SIZE):
+        for y in range(SIZE):
+            if len(dungeon.rooms[z][y]) != SIZE:
                 errors.append(f"Row size mismatch on floor {z}.")
-            for x in range(_SIZE):
+            for x in range(SIZE):
                 room = dungeon.rooms[z][y][x]
                 if room.feature == Feature.EXIT:
-                    if z != _SIZE - 1:
+                    if z != SIZE - 1:
                         errors.append("Exit placed on non-final floor.")
                     exit_count += 1
                 if room.treasure_id:
                     treasure_count += 1
+                    treasures[room.treasure_id] = (z, y, x)
                     if room.feature != Feature.EMPTY:
                         errors.append("Treasure placed in non-empty room.")
                 if room.monster_level > 0 and room.feature != Feature.EMPTY:
                     errors.append("Monster placed in room with feature.")
                 if room.feature == Feature.STAIRS_UP:
                     stairs_up_counts[z] += 1
-                    if z == _SIZE - 1:
+                    if z == SIZE - 1:
                         errors.append("Stairs up on final floor.")
                     elif dungeon.rooms[z + 1][y][x].feature != Feature.STAIRS_DOWN:
                         errors.append("Stair alignment mismatch.")
@@ -117,14 +120,14 @@ def validate_dungeon(dungeon: Dungeon) -> list[str]:
                         errors.append("Stairs down on first floor.")
                     elif dungeon.rooms[z - 1][y][x].feature != Feature.STAIRS_UP:
                         errors.append("Stair alignment mismatch.")
-                if room.feature in {Feature.EXIT, Feature.STAIRS_UP, Feature.STAIRS_DOWN}:
+                if room.feature in _FIXED_FEATURES:
                     if room.monster_level > 0 or room.treasure_id > 0:
                         errors.append("Feature placed in room with monster or treasure.")
 
-    for z in range(_SIZE):
-        if z < _SIZE - 1 and stairs_up_counts[z] != 1:
+    for z in range(SIZE):
+        if z < SIZE - 1 and stairs_up_counts[z] != 1:
             errors.append("Floor must contain exactly one staircase up.")
-        if z == _SIZE - 1 and stairs_up_counts[z] != 0:
+        if z == SIZE - 1 and stairs_up_counts[z] != 0:
             errors.append("Final floor must not contain staircase up.")
         if z > 0 and stairs_down_counts[z] != 1:
             errors.append("Floor must contain exactly one staircase down.")
@@ -135,5 +138,7 @@ def validate_dungeon(dungeon: Dungeon) -> list[str]:
         errors.append("Dungeon must contain exactly one exit.")
     if treasure_count != 10:
         errors.append("Dungeon must contain exactly 10 treasures.")
+    if dungeon.treasure_locations != treasures:
+        errors.append("Treasure index does not match room contents.")
 
     return errors
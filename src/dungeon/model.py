@@ -2,14 +2,31 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from dungeon.constants import Feature, Race, Spell
-
-
-def create_spell_counts() -> dict[Spell, int]:
-    return {spell: 0 for spell in Spell}
-
-
-@dataclass
+from dungeon.constants import (
+    ARMOR_NAMES,
+    ARMOR_PRICES,
+    WEAPON_NAMES,
+    WEAPON_PRICES,
+    Feature,
+    Race,
+    Spell,
+)
+
+# Base STR, DEX, IQ and HP per race, before the random rolls.
+_RACE_BASE_STATS = {
+    Race.HUMAN: (8, 8, 8, 20),
+    Race.DWARF: (10, 8, 6, 22),
+    Race.ELF: (6, 9, 10, 16),
+    Race.HALFLING: (6, 10, 9, 18),
+}
+
+
+def create_spell_counts() -> list[int]:
+    # Charges per spell, indexed by Spell value; slot 0 is unused.
+    return [0] * (len(Spell) + 1)
+
+
+@dataclass(slots=True)
 class Room:
     feature: Feature = Feature.EMPTY
     monster_level: int = 0
@@ -17,12 +34,27 @@ class Room:
     seen: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Dungeon:
     rooms: list[list[list[Room]]]
-
-
-@dataclass
+    # Uncollected treasure id -> (z, y, x), kept in sync as treasures are found.
+    treasure_locations: dict[int, tuple[int, int, int]] = field(init=False, repr=False)
+    # Flattened views of each floor, indexed by y * SIZE + x. They hold the same
+    # Room objects as rooms, so either can be used for reads and writes.
+    floors: list[list[Room]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.treasure_locations = {
+            room.treasure_id: (z, y, x)
+            for z, floor in enumerate(self.rooms)
+            for y, row in enumerate(floor)
+            for x, room in enumerate(row)
+            if room.treasure_id
+        }
+        self.floors = [[room for row in floor for room in row] for floor in self.rooms]
+
+
+@dataclass(slots=True)
 class Player:
     z: int
     y: int
@@ -38,7 +70,9 @@ class Player:
 
     gold: int
     flares: int
-    treasures_found: set[int] = field(default_factory=set)
+    # Bit n is set once treasure n has been collected.
+    treasures_found: int = 0
+    treasures_count: int = 0
 
     weapon_tier: int = 0
     armor_tier: int = 0
@@ -47,29 +81,23 @@ class Player:
     armor_name: str = "none"
     armor_damaged: bool = False
 
-    spells: dict[Spell, int] = field(default_factory=create_spell_counts)
+    spells: list[int] = field(default_factory=create_spell_counts)
 
     fatigued: bool = False
     temp_armor_bonus: int = 0
 
     @staticmethod
     def roll_base_stats(rng, race: Race) -> tuple[int, int, int, int]:
-        rn = rng.randint(0, 4)
-        rd = rng.randint(0, 4)
-        ra = rng.randint(0, 4)
-        r2 = rng.randint(0, 6)
-
-        match race:
-            case Race.HUMAN:
-                return 8 + rn, 8 + rd, 8 + ra, 20 + r2
-            case Race.DWARF:
-                return 10 + rn, 8 + rd, 6 + ra, 22 + r2
-            case Race.ELF:
-                return 6 + rn, 9 + rd, 10 + ra, 16 + r2
-            case Race.HALFLING:
-                return 6 + rn, 10 + rd, 9 + ra, 18 + r2
-            case _:
-                raise ValueError("Unknown race")
+        randint = rng.randint
+        rn = randint(0, 4)
+        rd = randint(0, 4)
+        ra = randint(0, 4)
+        r2 = randint(0, 6)
+
+        base = _RACE_BASE_STATS.get(race)
+        if base is None:
+            raise ValueError("Unknown race")
+        return base[0] + rn, base[1] + rd, base[2] + ra, base[3] + r2
 
     @classmethod
     def create(
@@ -82,13 +110,6 @@ class Player:
         armor_tier: int,
         flare_count: int,
     ) -> "Player":
-        from dungeon.constants import (
-            ARMOR_NAMES,
-            ARMOR_PRICES,
-            WEAPON_NAMES,
-            WEAPON_PRICES,
-        )
-
         str_, dex, iq, hp = cls.roll_base_stats(rng, race)
 
         str_add = int(allocations["STR"])
@@ -135,6 +156,24 @@ class Player:
             spells=create_spell_counts(),
         )
 
+    def equip_weapon(self, tier: int) -> None:
+        self.weapon_tier = tier
+        self.weapon_name = WEAPON_NAMES[tier]
+        self.weapon_broken = False
+
+    def equip_armor(self, tier: int) -> None:
+        self.armor_tier = tier
+        self.armor_name = ARMOR_NAMES[tier]
+        self.armor_damaged = False
+
+    def add_treasure(self, treasure_id: int) -> bool:
+        bit = 1 << treasure_id
+        if self.treasures_found & bit:
+            return False
+        self.treasures_found |= bit
+        self.treasures_count += 1
+        return True
+
     def apply_attribute_change(
         self,
         *,
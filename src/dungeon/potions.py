@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dungeon.types import Event
 
+_EV_DRINK = Event.info("You drink the potion...")
+_EV_HEALING = Event.info("Healing results.")
+
 
 def _attribute_outcome_text(*, target: str, change: int) -> str:
     match target:
@@ -30,14 +33,11 @@ def _attribute_outcome_text(*, target: str, change: int) -> str:
 
 
 def drink_healing_potion_events() -> list[Event]:
-    return [
-        Event.info("You drink the potion..."),
-        Event.info("Healing results."),
-    ]
+    return [_EV_DRINK, _EV_HEALING]
 
 
 def drink_attribute_potion_events(*, target: str, change: int) -> list[Event]:
     return [
-        Event.info("You drink the potion..."),
+        _EV_DRINK,
         Event.info(_attribute_outcome_text(target=target, change=change)),
     ]
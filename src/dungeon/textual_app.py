@@ -221,10 +221,11 @@ class DungeonTextualApp(App[None]):
 
     def _render_map(self, game: Game) -> str:
         lines = ["[b]Dungeon Map[/b]"]
+        floor = game.dungeon.floors[game.player.z]
         for y in range(game.SIZE):
             cells: list[str] = []
             for x in range(game.SIZE):
-                room = game.dungeon.rooms[game.player.z][y][x]
+                room = floor[y * game.SIZE + x]
                 if not room.seen:
                     symbol = "·"
                     display = "[#7e95b5]·[/]"
@@ -235,7 +236,7 @@ class DungeonTextualApp(App[None]):
                     symbol = "T"
                     display = symbol
                 else:
-                    symbol = FEATURE_SYMBOLS.get(room.feature, "-")
+                    symbol = FEATURE_SYMBOLS[room.feature]
                     display = symbol
                 if y == game.player.y and x == game.player.x:
                     cells.append(f"[reverse]{symbol}[/reverse]")
@@ -270,6 +271,7 @@ class DungeonTextualApp(App[None]):
     def _append_events(self, events: list[Event]) -> None:
         log = self.query_one("#event-log", RichLog)
         wrote_log_entry = False
+        saw_prompt = False
         for event in events:
             match event.kind:
                 case "INFO":
@@ -285,12 +287,13 @@ class DungeonTextualApp(App[None]):
                     log.write(f"[bold #9cffbc]• {event.text}[/]")
                     wrote_log_entry = True
                 case "PROMPT":
+                    saw_prompt = True
                     self._prompt_text = event.text
                     self._prompt_options = list(event.data.get("options", []))
                     self._prompt_has_cancel = bool(event.data.get("hasCancel"))
         if wrote_log_entry:
             log.write("")
-        if not any(e.kind == "PROMPT" for e in events):
+        if not saw_prompt:
             self._prompt_text = ""
             self._prompt_options = []
             self._prompt_has_cancel = False
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 from dungeon.constants import Mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     kind: str
     text: str
-    data: dict[str, Any] = field(default_factory=dict)
+    # Only the kinds that carry a payload (PROMPT, STATUS, MAP) set this.
+    data: dict[str, Any] | None = None
 
     @classmethod
     def info(cls, text: str) -> "Event":
@@ -58,7 +59,7 @@ class Event:
         return cls("DEBUG", text)
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     events: list[Event]
     mode: Mode
@@ -4,11 +4,9 @@ import random
 from dataclasses import dataclass
 
 from dungeon.constants import (
-    ARMOR_NAMES,
     ARMOR_PRICES,
     POTION_PRICES,
     SPELL_PRICES,
-    WEAPON_NAMES,
     WEAPON_PRICES,
     Race,
     Spell,
@@ -18,23 +16,53 @@ from dungeon.potions import drink_attribute_potion_events, drink_healing_potion_
 from dungeon.types import Event
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorResult:
     events: list[Event]
     done: bool = False
 
 
+_RACE_LABELS = {
+    Race.HUMAN: "Human",
+    Race.DWARF: "Dwarf",
+    Race.ELF: "Elf",
+    Race.HALFLING: "Halfling",
+}
+
+
 def _race_label(race: Race) -> str:
-    match race:
-        case Race.HUMAN:
-            return "Human"
-        case Race.DWARF:
-            return "Dwarf"
-        case Race.ELF:
-            return "Elf"
-        case Race.HALFLING:
-            return "Halfling"
-    return "Adventurer"
+    return _RACE_LABELS.get(race, "Adventurer")
+
+
+# Menu key -> item, shared across purchases.
+_WEAPON_KEYS = {"D": 1, "S": 2, "B": 3}
+_ARMOR_KEYS = {"L": 1, "W": 2, "C": 3}
+_SCROLL_KEYS = {
+    "P": Spell.PROTECTION,
+    "F": Spell.FIREBALL,
+    "L": Spell.LIGHTNING,
+    "W": Spell.WEAKEN,
+    "T": Spell.TELEPORT,
+}
+_ATTRIBUTE_KEYS = {"S": "STR", "D": "DEX", "I": "IQ", "M": "MHP"}
+_ATTRIBUTE_MENU = (
+    ("S", "Strength"),
+    ("D", "Dexterity"),
+    ("I", "Intelligence"),
+    ("M", "Max HP"),
+)
+
+_EV_CHOOSE_CATEGORY = Event.error("Choose W/A/S/P/F or Esc.")
+_EV_CHOOSE_WEAPON = Event.error("Choose D/S/B.")
+_EV_CHOOSE_ARMOR = Event.error("Choose L/W/C.")
+_EV_CHOOSE_SCROLL = Event.error("Choose P/F/L/W/T.")
+_EV_CHOOSE_POTION = Event.error("Choose H or A.")
+_EV_CHOOSE_ATTRIBUTE = Event.error("Choose S/D/I/M or Esc.")
+_EV_FAREWELL = Event.info("Perhaps another time.")
+_EV_BOUGHT_WEAPON = Event.info("A fine weapon for your quest.")
+_EV_BOUGHT_ARMOR = Event.info("Armor fitted and ready.")
+_EV_BOUGHT_SCROLL = Event.info("A scroll is yours.")
+_EV_BOUGHT_FLARES = Event.info("Ten flares, as promised.")
 
 
 class VendorSession:
@@ -60,17 +88,10 @@ class VendorSession:
         return "?> "
 
     def step(self, raw: str) -> VendorResult:
-        match self.phase:
-            case "category":
-                return self._handle_shop_category(raw)
-            case "item":
-                return self._handle_shop_item(raw)
-            case "attribute":
-                return self._handle_shop_attribute(raw)
-            case _:
-                return VendorResult(
-                    events=[Event.error("Choose W/A/S/P/F or Esc."), self._category_prompt()]
-                )
+        handler = self._PHASE_HANDLERS.get(self.phase)
+        if handler is None:
+            return VendorResult(events=[_EV_CHOOSE_CATEGORY, self._category_prompt()])
+        return handler(self, raw)
 
     def attempt_cancel(self) -> VendorResult:
         match self.phase:
@@ -82,7 +103,7 @@ class VendorSession:
                 self.category = None
                 return VendorResult(events=[self._category_prompt()])
             case _:
-                return VendorResult(events=[Event.info("Perhaps another time.")], done=True)
+                return VendorResult(events=[_EV_FAREWELL], done=True)
 
     def _handle_shop_category(self, raw: str) -> VendorResult:
         match raw:
@@ -94,79 +115,49 @@ class VendorSession:
                 return self._purchase_flares()
             case _:
                 return VendorResult(
-                    events=[Event.error("Choose W/A/S/P/F or Esc."), self._category_prompt()]
+                    events=[_EV_CHOOSE_CATEGORY, self._category_prompt()]
                 )
 
     def _handle_shop_item(self, raw: str) -> VendorResult:
-        match self.category:
-            case "W":
-                return self._handle_shop_weapons(raw)
-            case "A":
-                return self._handle_shop_armor(raw)
-            case "S":
-                return self._handle_shop_scrolls(raw)
-            case "P":
-                return self._handle_shop_potions(raw)
-            case _:
-                return VendorResult(
-                    events=[Event.error("Choose W/A/S/P/F or Esc."), self._category_prompt()]
-                )
+        handler = self._ITEM_HANDLERS.get(self.category)
+        if handler is None:
+            return VendorResult(events=[_EV_CHOOSE_CATEGORY, self._category_prompt()])
+        return handler(self, raw)
 
     def _handle_shop_weapons(self, raw: str) -> VendorResult:
-        tiers = {"D": 1, "S": 2, "B": 3}
-        tier = tiers.get(raw)
+        tier = _WEAPON_KEYS.get(raw)
         if tier is None:
-            return VendorResult(events=[Event.error("Choose D/S/B."), self._item_prompt()])
-        price = WEAPON_PRICES[tier]
-        if self.player.gold < price:
+            return VendorResult(events=[_EV_CHOOSE_WEAPON, self._item_prompt()])
+        if not self._charge(WEAPON_PRICES[tier]):
             return VendorResult(events=[self._insufficient_gold_message(), self._item_prompt()])
-        self.player.weapon_tier = tier
-        self.player.weapon_name = WEAPON_NAMES[tier]
-        self.player.weapon_broken = False
-        self.player.gold -= price
-        return VendorResult(events=[Event.info("A fine weapon for your quest.")], done=True)
+        self.player.equip_weapon(tier)
+        return VendorResult(events=[_EV_BOUGHT_WEAPON], done=True)
 
     def _handle_shop_armor(self, raw: str) -> VendorResult:
-        tiers = {"L": 1, "W": 2, "C": 3}
-        tier = tiers.get(raw)
+        tier = _ARMOR_KEYS.get(raw)
         if tier is None:
-            return VendorResult(events=[Event.error("Choose L/W/C."), self._item_prompt()])
-        price = ARMOR_PRICES[tier]
-        if self.player.gold < price:
+            return VendorResult(events=[_EV_CHOOSE_ARMOR, self._item_prompt()])
+        if not self._charge(ARMOR_PRICES[tier]):
             return VendorResult(events=[self._insufficient_gold_message(), self._item_prompt()])
-        self.player.armor_tier = tier
-        self.player.armor_name = ARMOR_NAMES[tier]
-        self.player.armor_damaged = False
-        self.player.gold -= price
-        return VendorResult(events=[Event.info("Armor fitted and ready.")], done=True)
+        self.player.equip_armor(tier)
+        return VendorResult(events=[_EV_BOUGHT_ARMOR], done=True)
 
     def _handle_shop_scrolls(self, raw: str) -> VendorResult:
-        spells = {
-            "P": Spell.PROTECTION,
-            "F": Spell.FIREBALL,
-            "L": Spell.LIGHTNING,
-            "W": Spell.WEAKEN,
-            "T": Spell.TELEPORT,
-        }
-        spell = spells.get(raw)
+        spell = _SCROLL_KEYS.get(raw)
         if spell is None:
-            return VendorResult(events=[Event.error("Choose P/F/L/W/T."), self._item_prompt()])
-        price = SPELL_PRICES[spell]
-        if self.player.gold < price:
+            return VendorResult(events=[_EV_CHOOSE_SCROLL, self._item_prompt()])
+        if not self._charge(SPELL_PRICES[spell]):
             return VendorResult(events=[self._insufficient_gold_message(), self._item_prompt()])
-        self.player.gold -= price
-        self.player.spells[spell] = self.player.spells.get(spell, 0) + 1
-        return VendorResult(events=[Event.info("A scroll is yours.")], done=True)
+        self.player.spells[spell] += 1
+        return VendorResult(events=[_EV_BOUGHT_SCROLL], done=True)
 
     def _handle_shop_potions(self, raw: str) -> VendorResult:
         match raw:
             case "H":
-                price = POTION_PRICES["HEALING"]
-                if self.player.gold < price:
+                if not self._charge(POTION_PRICES["HEALING"]):
                     return VendorResult(
                         events=[self._insufficient_gold_message(), self._item_prompt()]
                     )
-                self.player.gold -= price
                 self.player.hp = min(self.player.mhp, self.player.hp + 10)
                 return VendorResult(events=drink_healing_potion_events(), done=True)
             case "A":
@@ -177,27 +168,20 @@ class VendorSession:
                 self.phase = "attribute"
                 return VendorResult(events=[self._attribute_prompt()])
             case _:
-                return VendorResult(events=[Event.error("Choose H or A."), self._item_prompt()])
+                return VendorResult(events=[_EV_CHOOSE_POTION, self._item_prompt()])
 
     def _purchase_flares(self) -> VendorResult:
-        price = 10
-        if self.player.gold < price:
+        if not self._charge(10):
             return VendorResult(events=[self._insufficient_gold_message(), self._category_prompt()])
-        self.player.gold -= price
         self.player.flares += 10
-        return VendorResult(events=[Event.info("Ten flares, as promised.")], done=True)
+        return VendorResult(events=[_EV_BOUGHT_FLARES], done=True)
 
     def _handle_shop_attribute(self, raw: str) -> VendorResult:
-        targets = {"S": "STR", "D": "DEX", "I": "IQ", "M": "MHP"}
-        target = targets.get(raw)
+        target = _ATTRIBUTE_KEYS.get(raw)
         if target is None:
-            return VendorResult(
-                events=[Event.error("Choose S/D/I/M or Esc."), self._attribute_prompt()]
-            )
-        price = POTION_PRICES["ATTRIBUTE"]
-        if self.player.gold < price:
+            return VendorResult(events=[_EV_CHOOSE_ATTRIBUTE, self._attribute_prompt()])
+        if not self._charge(POTION_PRICES["ATTRIBUTE"]):
             return VendorResult(events=[self._insufficient_gold_message()], done=True)
-        self.player.gold -= price
         change = self.rng.randint(1, 3)
         self.player.apply_attribute_change(target=target, change=change)
         return VendorResult(
@@ -205,6 +189,14 @@ class VendorSession:
             done=True,
         )
 
+    def _charge(self, price: int) -> bool:
+        # Takes the price only when the player can cover it.
+        player = self.player
+        if player.gold < price:
+            return False
+        player.gold -= price
+        return True
+
     def _insufficient_gold_message(self) -> Event:
         return Event.info(
             f"Don't try to cheat me, you foolish {_race_label(self.player.race)}. It won't work!"
@@ -323,10 +315,23 @@ class VendorSession:
         return Event.prompt(
             "Choose an attribute:",
             options=[
-                {"key": "S", "label": "Strength", "disabled": False},
-                {"key": "D", "label": "Dexterity", "disabled": False},
-                {"key": "I", "label": "Intelligence", "disabled": False},
-                {"key": "M", "label": "Max HP", "disabled": False},
+                {"key": key, "label": label, "disabled": False}
+                for key, label in _ATTRIBUTE_MENU
             ],
             has_cancel=True,
         )
+
+    _PHASE_HANDLERS = {
+        "category": _handle_shop_category,
+        "item": _handle_shop_item,
+        "attribute": _handle_shop_attribute,
+    }
+
+    # Item handlers by shop category; flares are bought straight from the
+    # category menu.
+    _ITEM_HANDLERS = {
+        "W": _handle_shop_weapons,
+        "A": _handle_shop_armor,
+        "S": _handle_shop_scrolls,
+        "P": _handle_shop_potions,
+    }
@@ -1,6 +1,13 @@
 import random
 
-from dungeon.constants import Feature, Race, Spell
+from dungeon.constants import (
+    ARMOR_NAMES,
+    EXPLORE_COMMANDS,
+    TREASURE_NAMES,
+    Feature,
+    Race,
+    Spell,
+)
 from dungeon.engine import Game
 from dungeon.model import Player
 
@@ -29,20 +36,34 @@ def test_warp_relocates():
     assert end != start
 
 
+def test_warp_chain_ends_in_only_plain_room():
+    game = _make_game(5)
+    for floor in game.dungeon.floors:
+        for room in floor:
+            room.feature = Feature.WARP
+            room.monster_level = 0
+    target = game.dungeon.floors[3][3 * game.SIZE + 3]
+    target.feature = Feature.EMPTY
+    events = game._enter_room()
+    assert game._current_room() is target
+    assert len(events) > 1
+    assert events[-1].text == "This room is empty."
+
+
 def test_treasure_awarded_on_kill():
     game = _make_game(6)
     room = game._current_room()
     room.treasure_id = 1
     room.monster_level = 1
     game._enter_room()
-    assert 1 not in game.player.treasures_found
+    assert not game.player.treasures_found & (1 << 1)
     session = game._encounter_session
     assert session is not None
     session.vitality = 1
-    session.rng.random = lambda: 0.0
-    session.rng.randint = lambda _a, _b: 1
+    session._getrandbits = lambda _k: 1023
+    session._randint = lambda _a, _b: 1
     game.step("F")
-    assert 1 in game.player.treasures_found
+    assert game.player.treasures_found & (1 << 1)
 
 
 def test_spell_clamping_never_increases_vitality():
@@ -67,3 +88,62 @@ def test_spell_clamping_never_increases_vitality():
     before = session.vitality
     session._cast_spell(Spell.LIGHTNING)
     assert session.vitality <= before
+
+
+def test_mirror_reveals_uncollected_treasure():
+    game = _make_game(9)
+    room = game._current_room()
+    room.feature = Feature.MIRROR
+    room.treasure_id = 0
+    room.monster_level = 0
+    game.player.iq = 50
+    treasure_id = next(iter(game.dungeon.treasure_locations))
+    game._award_treasure(treasure_id, [])
+    assert treasure_id not in game.dungeon.treasure_locations
+
+    events = game._use_mirror()
+
+    assert len(events) == 1
+    assert events[0].text.startswith("You see the ")
+    assert TREASURE_NAMES[treasure_id - 1] not in events[0].text
+
+
+def test_status_reflects_player_changes():
+    game = _make_game(11)
+    gold = game.status_events()[0].data["gold"]
+    game.player.gold += 5
+    assert game.status_events()[0].data["gold"] == gold + 5
+
+
+def test_random_relocate_never_stays_put():
+    game = _make_game(12)
+    for _ in range(200):
+        start = (game.player.y, game.player.x)
+        game._random_relocate(any_floor=False)
+        assert (game.player.y, game.player.x) != start
+        assert 0 <= game.player.y < 7 and 0 <= game.player.x < 7
+
+
+def test_explore_handlers_cover_explore_commands():
+    assert set(Game._EXPLORE_HANDLERS) == EXPLORE_COMMANDS
+
+
+def test_chest_is_emptied_once_opened():
+    game = _make_game(11)
+    room = game._current_room()
+    room.feature = Feature.CHEST
+    assert game._open_chest()
+    assert room.feature == Feature.EMPTY
+    assert game._open_chest()[0].text == "There is no chest here."
+
+
+def test_exploding_chest_destroys_last_armour():
+    game = _make_game(12)
+    room = game._current_room()
+    room.feature = Feature.CHEST
+    game.player.equip_armor(1)
+    game.rng.randint = lambda _a, _b: 1
+    game._open_chest()
+    assert game.player.armor_tier == 0
+    assert game.player.armor_name == ARMOR_NAMES[0]
+    assert game.player.armor_damaged is False
@@ -1,6 +1,7 @@
 import random
 
-from dungeon.constants import Feature, Mode, Race
+from dungeon.constants import ENCOUNTER_COMMANDS, Feature, Mode, Race, Spell
+from dungeon.encounter import EncounterSession
 from dungeon.engine import Game
 from dungeon.model import Player
 
@@ -34,7 +35,7 @@ def test_run_success_relocates():
     def _relocate(*_, **__) -> None:
         game.player.z, game.player.y, game.player.x = target
 
-    game.rng.random = lambda: 0.0
+    game._encounter_session._getrandbits = lambda _k: 0
     game._random_relocate = _relocate
     result = game.step("R")
     events = result.events
@@ -49,7 +50,7 @@ def test_run_fail_sets_fatigued():
     room = game._current_room()
     room.monster_level = 1
     game._enter_room()
-    game.rng.random = lambda: 0.5
+    game._encounter_session._getrandbits = lambda _k: 1023
     result = game.step("R")
     events = result.events
     assert game.player.fatigued is True
@@ -68,3 +69,20 @@ def test_spell_prompt_uses_letter_commands():
     assert prompt.data["hasCancel"] is True
     keys = [opt["key"] for opt in prompt.data["options"]]
     assert keys == ["P", "F", "L", "W", "T"]
+
+
+def test_teleport_spell_ends_encounter():
+    game = _make_game(4)
+    room = game._current_room()
+    room.monster_level = 1
+    game._enter_room()
+    session = game._encounter_session
+    assert session is not None
+    result = session._cast_spell(Spell.TELEPORT)
+    assert result.done is True
+    assert result.relocate is True
+    assert session.vitality == 0
+
+
+def test_command_handlers_cover_encounter_commands():
+    assert set(EncounterSession._COMMAND_HANDLERS) == ENCOUNTER_COMMANDS
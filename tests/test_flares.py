@@ -33,3 +33,32 @@ def test_flare_reveal_neighbors():
             if dy == 0 and dx == 0:
                 continue
             assert game.dungeon.rooms[0][3 + dy][3 + dx].seen is True
+
+
+def test_flare_clips_at_corner():
+    rng = random.Random(2)
+    player = Player.create(
+        rng=rng,
+        race=Race.HUMAN,
+        allocations={"STR": 2, "DEX": 2, "IQ": 1},
+        weapon_tier=1,
+        armor_tier=1,
+        flare_count=1,
+    )
+    game = Game(seed=2, player=player, rng=rng)
+    for row in game.dungeon.rooms[0]:
+        for room in row:
+            room.seen = False
+    game.player.z = 0
+    game.player.y = 0
+    game.player.x = 6
+
+    game._use_flare()
+
+    seen = {
+        (y, x)
+        for y, row in enumerate(game.dungeon.rooms[0])
+        for x, room in enumerate(row)
+        if room.seen
+    }
+    assert seen == {(0, 5), (0, 6), (1, 5), (1, 6)}
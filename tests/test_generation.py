@@ -1,6 +1,7 @@
 import random
 
 from dungeon.generation import generate_dungeon, validate_dungeon
+from dungeon.model import Dungeon
 
 
 def test_generation_invariants():
@@ -8,3 +9,11 @@ def test_generation_invariants():
     dungeon = generate_dungeon(rng)
     errors = validate_dungeon(dungeon)
     assert errors == []
+
+
+def test_treasure_index_built_from_rooms():
+    generated = generate_dungeon(random.Random(0))
+    dungeon = Dungeon(rooms=generated.rooms)
+    assert dungeon.treasure_locations == generated.treasure_locations
+    assert len(dungeon.treasure_locations) == 10
+    assert validate_dungeon(dungeon) == []
@@ -0,0 +1,43 @@
+import random
+
+from dungeon.constants import Feature, Race
+from dungeon.engine import Game
+from dungeon.model import Player
+
+
+def _make_game(seed: int) -> Game:
+    rng = random.Random(seed)
+    player = Player.create(
+        rng=rng,
+        race=Race.HUMAN,
+        allocations={"STR": 2, "DEX": 2, "IQ": 1},
+        weapon_tier=1,
+        armor_tier=1,
+        flare_count=0,
+    )
+    return Game(seed=seed, player=player, rng=rng)
+
+
+def test_map_grid_symbols():
+    game = _make_game(1)
+    for row in game.dungeon.rooms[0]:
+        for room in row:
+            room.seen = False
+            room.monster_level = 0
+            room.treasure_id = 0
+            room.feature = Feature.EMPTY
+    game.player.y = 3
+    game.player.x = 3
+    game.dungeon.rooms[0][0][0].seen = True
+    game.dungeon.rooms[0][0][1].seen = True
+    game.dungeon.rooms[0][0][1].feature = Feature.MIRROR
+    game.dungeon.rooms[0][0][2].seen = True
+    game.dungeon.rooms[0][0][2].monster_level = 1
+    game.dungeon.rooms[0][0][3].seen = True
+    game.dungeon.rooms[0][0][3].treasure_id = 1
+
+    grid = game._map_grid()
+
+    assert len(grid) == 7
+    assert grid[0] == "- m M T · · ·"
+    assert grid[3] == "· · · * · · ·"
@@ -3,6 +3,7 @@ import random
 from dungeon.constants import Feature, Race
 from dungeon.engine import Game
 from dungeon.model import Player
+from dungeon.vendor import VendorSession
 
 
 def _make_game(seed: int) -> Game:
@@ -48,3 +49,33 @@ def test_vendor_starts_session_with_letter_prompt():
     assert prompt is not None
     keys = [opt["key"] for opt in prompt.data["options"]]
     assert keys == ["W", "A", "S", "P", "F"]
+
+
+def test_vendor_charges_only_when_affordable():
+    game = _make_game(10)
+    room = game._current_room()
+    room.feature = Feature.VENDOR
+    game._enter_room()
+    game.step("B")
+
+    game.player.gold = 9
+    result = game.step("F")
+    assert game.player.gold == 9
+    assert game._shop_session is not None
+    assert any("cheat" in e.text for e in result.events)
+
+    game.player.gold = 10
+    flares = game.player.flares
+    game.step("F")
+    assert game.player.gold == 0
+    assert game.player.flares == flares + 10
+    assert game._shop_session is None
+
+
+def test_attribute_prompt_options_are_not_shared():
+    game = _make_game(10)
+    first = VendorSession(rng=game.rng, player=game.player)._attribute_prompt()
+    second = VendorSession(rng=game.rng, player=game.player)._attribute_prompt()
+    first.data["options"][0]["disabled"] = True
+    assert second.data["options"][0]["disabled"] is False
+    assert [opt["key"] for opt in second.data["options"]] == ["S", "D", "I", "M"]